@@ -6,6 +6,7 @@ from .exceptions import (
     WeerliveError,
     WeerliveRateLimitError,
 )
+from .keypool import WeerliveKeyPool
 from .models import Weather
 from .weerlive import Weerlive
 
@@ -15,5 +16,6 @@ __all__ = [
     "WeerliveAuthenticationError",
     "WeerliveConnectionError",
     "WeerliveError",
+    "WeerliveKeyPool",
     "WeerliveRateLimitError",
 ]
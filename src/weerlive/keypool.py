@@ -0,0 +1,176 @@
+"""Asynchronous Python client for Weerlive."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import InitVar, dataclass, field
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from .exceptions import WeerliveAuthenticationError, WeerliveRateLimitError
+
+# The daily limit of the Weerlive API resets at midnight Dutch time
+RESET_TIMEZONE = "Europe/Amsterdam"
+
+
+@dataclass
+class ApiKeyState:
+    """Usage and availability of a single API key in the pool."""
+
+    key: str = field(repr=False)
+    weight: float = 1.0
+    requests: int = 0
+    rate_limited: bool = False
+    invalid: bool = False
+
+    @property
+    def available(self) -> bool:
+        """Return whether the key can currently be used."""
+        return not self.rate_limited and not self.invalid
+
+
+@dataclass
+class WeerliveKeyPool:
+    """Pool of API keys to spread requests over.
+
+    Every request goes to the available key with the fewest requests today
+    relative to its weight. Rate limited keys return to the pool after the
+    daily reset, invalid keys are removed permanently.
+    """
+
+    keys: InitVar[list[str] | dict[str, float]]
+
+    _states: list[ApiKeyState] = field(init=False, repr=False)
+    _day: date = field(init=False, repr=False)
+
+    def __post_init__(self, keys: list[str] | dict[str, float]) -> None:
+        """Validate the keys and set up the state per key.
+
+        Args:
+        ----
+            keys: The API keys, optionally mapped to their weight.
+
+        Raises:
+        ------
+            ValueError: If the pool is empty, contains duplicate or empty keys,
+                or a key has a weight that is not a positive number.
+
+        """
+        if isinstance(keys, dict):
+            weights = keys
+        else:
+            weights = dict.fromkeys(keys, 1.0)
+            if len(weights) != len(keys):
+                msg = "API keys in the pool must be unique"
+                raise ValueError(msg)
+        if not weights:
+            msg = "The pool needs at least one API key"
+            raise ValueError(msg)
+        for key, weight in weights.items():
+            if not key:
+                msg = "API keys in the pool can not be empty"
+                raise ValueError(msg)
+            if not math.isfinite(weight) or weight <= 0:
+                msg = f"Weight of API key must be positive, got {weight}"
+                raise ValueError(msg)
+
+        self._states = [ApiKeyState(key, weight) for key, weight in weights.items()]
+        self._day = self._today()
+
+    @property
+    def day(self) -> date:
+        """Return the day the current usage and rate limits apply to."""
+        self._reset_if_new_day()
+        return self._day
+
+    @property
+    def usage(self) -> dict[str, int]:
+        """Return the number of requests made today per key."""
+        self._reset_if_new_day()
+        return {state.key: state.requests for state in self._states}
+
+    @property
+    def available_keys(self) -> list[str]:
+        """Return the keys that are currently in rotation."""
+        self._reset_if_new_day()
+        return [state.key for state in self._states if state.available]
+
+    def acquire(self) -> str:
+        """Select the key to use for the next request.
+
+        Returns
+        -------
+            The least used available API key, taking weights into account.
+
+        Raises
+        ------
+            WeerliveAuthenticationError: If there are no valid keys left.
+            WeerliveRateLimitError: If all valid keys exceeded the daily limit.
+
+        """
+        self._reset_if_new_day()
+        candidates = [state for state in self._states if state.available]
+        if not candidates:
+            if all(state.invalid for state in self._states):
+                msg = "No valid API key left in the pool"
+                raise WeerliveAuthenticationError(msg)
+            msg = "The API rate limit has been exceeded for all keys in the pool"
+            raise WeerliveRateLimitError(msg)
+
+        state = min(candidates, key=lambda state: state.requests / state.weight)
+        state.requests += 1
+        return state.key
+
+    def mark_rate_limited(self, key: str, day: date | None = None) -> None:
+        """Take a key out of rotation until the next daily reset.
+
+        Args:
+        ----
+            key: The API key that hit the daily limit.
+            day: The day the key was acquired on, a limit reported for
+                a day before the last reset is ignored.
+
+        """
+        state = self._state(key)
+        self._reset_if_new_day()
+        if day is not None and day < self._day:
+            return
+        state.rate_limited = True
+
+    def mark_invalid(self, key: str) -> None:
+        """Take a key out of rotation permanently.
+
+        Args:
+        ----
+            key: The API key that was rejected by the API.
+
+        """
+        self._state(key).invalid = True
+
+    def _state(self, key: str) -> ApiKeyState:
+        """Return the state of a key in the pool.
+
+        Raises
+        ------
+            KeyError: If the key is not part of the pool.
+
+        """
+        for state in self._states:
+            if state.key == key:
+                return state
+        raise KeyError(key)
+
+    def _reset_if_new_day(self) -> None:
+        """Reset the usage and rate limits after the daily reset."""
+        today = self._today()
+        if today == self._day:
+            return
+        self._day = today
+        for state in self._states:
+            state.requests = 0
+            state.rate_limited = False
+
+    @staticmethod
+    def _today() -> date:
+        """Return the current date in the timezone of the daily reset."""
+        return datetime.now(ZoneInfo(RESET_TIMEZONE)).date()
@@ -18,6 +18,7 @@ from .exceptions import (
     WeerliveError,
     WeerliveRateLimitError,
 )
+from .keypool import WeerliveKeyPool
 from .models import Weather
 
 VERSION = metadata.version(__package__)
@@ -27,7 +28,7 @@ VERSION = metadata.version(__package__)
 class Weerlive:
     """Main class for handling connections with the Weerlive API."""
 
-    api_key: str
+    api_key: str | WeerliveKeyPool
     latitude: float
     longitude: float
     request_timeout: float = 10.0
@@ -58,6 +59,7 @@ class Weerlive:
         Raises:
         ------
             WeerliveAuthenticationError: If the API key is invalid.
+            WeerliveRateLimitError: If the API rate limit has been exceeded.
             WeerliveConnectionError: An error occurred while communicating
                 with the Weerlive API.
             WeerliveError: Received an unexpected response from the Weerlive API.
@@ -115,6 +117,51 @@ class Weerlive:
 
         return await response.json()
 
+    async def _request_with_key(
+        self,
+        uri: str,
+        *,
+        params: dict[str, Any],
+    ) -> Any:
+        """Handle a request that is authenticated with an API key.
+
+        With a key pool, keys that hit the daily limit or are invalid are
+        taken out of rotation and the request is retried with the next key.
+
+        Args:
+        ----
+            uri: Request URI, without '/api/', for example, 'status'.
+            params: Extra options to improve or limit the response.
+
+        Returns:
+        -------
+            A Python dictionary (JSON decoded) with the response from
+            the Weerlive API.
+
+        Raises:
+        ------
+            WeerliveAuthenticationError: If the API key is invalid, or no valid
+                key is left in the pool.
+            WeerliveRateLimitError: If the API rate limit has been exceeded,
+                for all keys in the pool.
+            WeerliveConnectionError: An error occurred while communicating
+                with the Weerlive API.
+            WeerliveError: Received an unexpected response from the Weerlive API.
+
+        """
+        if not isinstance(self.api_key, WeerliveKeyPool):
+            return await self._request(uri, params={**params, "key": self.api_key})
+
+        while True:
+            key = self.api_key.acquire()
+            day = self.api_key.day
+            try:
+                return await self._request(uri, params={**params, "key": key})
+            except WeerliveRateLimitError:
+                self.api_key.mark_rate_limited(key, day)
+            except WeerliveAuthenticationError:
+                self.api_key.mark_invalid(key)
+
     async def weather(self) -> Weather:
         """Get the current weather forecast.
 
@@ -123,10 +170,9 @@ class Weerlive:
             A Weather data object from the API.
 
         """
-        data = await self._request(
+        data = await self._request_with_key(
             "json-data-10min.php",
             params={
-                "key": self.api_key,
                 "locatie": f"{self.latitude},{self.longitude}",
             },
         )
@@ -0,0 +1,163 @@
+"""Key pool tests for Weerlive."""
+
+# pylint: disable=protected-access
+
+from collections.abc import Awaitable, Callable
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp.web_request import Request
+from aresponses import Response, ResponsesMockServer
+
+from weerlive import Weerlive, WeerliveKeyPool
+from weerlive.exceptions import WeerliveAuthenticationError, WeerliveRateLimitError
+
+from . import load_fixtures
+
+
+def _key_response(
+    responses: dict[str, str],
+) -> Callable[[Request], Awaitable[Response]]:
+    """Return a handler that responds with a fixture based on the API key."""
+
+    async def response_handler(request: Request) -> Response:
+        return Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixtures(responses[request.query["key"]]),
+        )
+
+    return response_handler
+
+
+def test_least_used_selection() -> None:
+    """Test requests are spread evenly over the keys."""
+    pool = WeerliveKeyPool(["a", "b", "c"])
+    assert [pool.acquire() for _ in range(6)] == ["a", "b", "c", "a", "b", "c"]
+    assert pool.usage == {"a": 2, "b": 2, "c": 2}
+
+
+def test_weighted_selection() -> None:
+    """Test requests are spread according to the weights."""
+    pool = WeerliveKeyPool({"a": 3, "b": 1})
+    for _ in range(8):
+        pool.acquire()
+    assert pool.usage == {"a": 6, "b": 2}
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        [],
+        {},
+        ["a", ""],
+        ["a", "a", "b"],
+        {"a": 1, "b": 0},
+        {"a": float("nan")},
+        {"a": float("inf")},
+    ],
+)
+def test_invalid_pool(keys: list[str] | dict[str, float]) -> None:
+    """Test empty pools, duplicate keys and invalid weights are rejected."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        WeerliveKeyPool(keys)
+
+
+def test_daily_reset() -> None:
+    """Test rate limited keys and usage are restored at the daily reset."""
+    pool = WeerliveKeyPool(["a", "b"])
+    pool.acquire()
+    pool.mark_rate_limited("a")
+    pool.mark_invalid("b")
+    assert pool.available_keys == []
+    with pytest.raises(WeerliveRateLimitError):
+        pool.acquire()
+
+    with patch.object(WeerliveKeyPool, "_today", return_value=date(2099, 1, 1)):
+        assert pool.available_keys == ["a"]
+        assert pool.usage == {"a": 0, "b": 0}
+
+
+def test_rate_limit_previous_day() -> None:
+    """Test a limit reported for the day before the reset is ignored."""
+    pool = WeerliveKeyPool(["a"])
+    key = pool.acquire()
+    day = pool.day
+
+    with patch.object(WeerliveKeyPool, "_today", return_value=date(2099, 1, 1)):
+        pool.acquire()
+        pool.mark_rate_limited(key, day)
+        assert pool.available_keys == ["a"]
+
+        pool.mark_rate_limited(key, pool.day)
+        assert pool.available_keys == []
+
+
+def test_repr_hides_keys() -> None:
+    """Test the API keys do not end up in the representation of the pool."""
+    pool = WeerliveKeyPool(["secret"])
+    assert "secret" not in repr(pool)
+    assert "secret" not in repr(pool._state("secret"))
+
+
+def test_unknown_key() -> None:
+    """Test marking a key that is not part of the pool."""
+    pool = WeerliveKeyPool(["a"])
+    with pytest.raises(KeyError):
+        pool.mark_invalid("b")
+
+
+async def test_pool_failover(aresponses: ResponsesMockServer) -> None:
+    """Test rate limited and invalid keys are skipped by the client."""
+    aresponses.add(
+        "weerlive.nl",
+        "/api/json-data-10min.php",
+        "GET",
+        _key_response(
+            {
+                "limited": "error_rate_limit.txt",
+                "invalid": "error_auth.txt",
+                "valid": "weather.json",
+            }
+        ),
+        repeat=aresponses.INFINITY,
+    )
+    pool = WeerliveKeyPool(["limited", "invalid", "valid"])
+    async with ClientSession() as session:
+        client = Weerlive(
+            api_key=pool,
+            longitude=52.1015832,
+            latitude=5.1785422,
+            session=session,
+        )
+        await client.weather()
+        await client.weather()
+
+    assert pool.available_keys == ["valid"]
+    assert pool.usage == {"limited": 1, "invalid": 1, "valid": 2}
+
+
+async def test_pool_exhausted(aresponses: ResponsesMockServer) -> None:
+    """Test errors once no key in the pool can be used."""
+    aresponses.add(
+        "weerlive.nl",
+        "/api/json-data-10min.php",
+        "GET",
+        _key_response({"limited": "error_rate_limit.txt", "invalid": "error_auth.txt"}),
+        repeat=aresponses.INFINITY,
+    )
+    async with ClientSession() as session:
+        client = Weerlive(
+            api_key=WeerliveKeyPool(["limited", "invalid"]),
+            longitude=52.1015832,
+            latitude=5.1785422,
+            session=session,
+        )
+        with pytest.raises(WeerliveRateLimitError):
+            await client.weather()
+
+        client.api_key = WeerliveKeyPool(["invalid"])
+        with pytest.raises(WeerliveAuthenticationError):
+            await client.weather()